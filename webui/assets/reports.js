@@ -0,0 +1,68 @@
+/* Clientside callbacks for the reports panel */
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    reports: {
+        // Map navigation button ids to report tab ids
+        switchTab: function() {
+            const triggered = dash_clientside.callback_context.triggered;
+            if (!triggered || !triggered.length) {
+                return "market-analysis";
+            }
+
+            const triggerId = triggered[0].prop_id.split(".")[0];
+            const tabMapping = {
+                "nav-market": "market-analysis",
+                "nav-social": "social-sentiment",
+                "nav-news": "news-analysis",
+                "nav-fundamentals": "fundamentals-analysis",
+                "nav-researcher": "researcher-debate",
+                "nav-research-mgr": "research-manager",
+                "nav-trader": "trader-plan",
+                "nav-risk-agg": "risk-debate",
+                "nav-risk-cons": "risk-debate",
+                "nav-risk-neut": "risk-debate",
+                "nav-final": "final-decision"
+            };
+
+            return tabMapping[triggerId] || "market-analysis";
+        },
+
+        // Highlight the clicked symbol button and sync the report/chart pages
+        selectSymbol: function(symbolClicks) {
+            const noUpdate = window.dash_clientside.no_update;
+            const triggered = dash_clientside.callback_context.triggered;
+            if (!symbolClicks || !symbolClicks.some(Boolean) || !triggered || !triggered.length) {
+                return [noUpdate, noUpdate, noUpdate, noUpdate];
+            }
+
+            const propId = triggered[0].prop_id;
+            const clickedIndex = JSON.parse(propId.slice(0, propId.lastIndexOf("."))).index;
+            if (!(clickedIndex >= 0 && clickedIndex < symbolClicks.length)) {
+                return [noUpdate, noUpdate, noUpdate, noUpdate];
+            }
+
+            const pageNumber = clickedIndex + 1;
+            const colors = symbolClicks.map(function(_, i) {
+                return i === clickedIndex ? "primary" : "outline-primary";
+            });
+            const classNames = symbolClicks.map(function(_, i) {
+                return i === clickedIndex ? "symbol-btn active" : "symbol-btn ";
+            });
+
+            return [pageNumber, pageNumber, colors, classNames];
+        },
+
+        // Show the symbol for the active report page using the rendered symbol buttons
+        reportDisplayText: function(activePage, symbols) {
+            if (!symbols || !symbols.length || !activePage) {
+                return "";
+            }
+
+            if (activePage > symbols.length) {
+                return "Invalid page";
+            }
+
+            return "📊 " + symbols[activePage - 1];
+        }
+    }
+});
@@ -3,12 +3,123 @@ Report-related callbacks for TradingAgents WebUI
 Enhanced with symbol-based pagination
 """
 
-from dash import Input, Output, State, ctx, html, ALL, dash, dcc, callback_context
+import functools
+import json
+import re
+from dash import Input, Output, State, ctx, html, ALL, dash, dcc, ClientsideFunction, Patch
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 from webui.utils.state import app_state
-from webui.components.ui import render_researcher_debate, render_risk_debate
 from webui.utils.report_validator import validate_reports_for_ui
 from webui.utils.prompt_capture import get_agent_prompt
+from webui.components.prompt_modal import create_show_prompt_button
+from webui.components.tool_outputs_modal import create_show_tool_outputs_button
+
+# Index of a clicked report symbol button in its triggered prop_id
+_SYMBOL_BTN_INDEX_RE = re.compile(r'"index":(\d+)')
+
+# Shared style dicts - Dash only reads these, so one instance serves every render
+_MD_STYLE = {
+    "background": "linear-gradient(135deg, #0F172A 0%, #1E293B 100%)",
+    "border-radius": "8px",
+    "padding": "1.5rem",
+    "border": "1px solid rgba(51, 65, 85, 0.3)",
+    "min-height": "1000px",
+    "color": "#E2E8F0",
+    "line-height": "1.6"
+}
+
+_DEBATE_CONTAINER_STYLE = {
+    "background": "linear-gradient(135deg, #0F172A 0%, #1E293B 100%)",
+    "border-radius": "8px",
+    "padding": "1.5rem",
+    "min-height": "1000px",
+    "maxHeight": "600px",
+    "overflowY": "auto"
+}
+
+_GREEN_MESSAGE_STYLE = {
+    "background": "linear-gradient(135deg, #064E3B 0%, #047857 100%)",
+    "border-radius": "8px",
+    "padding": "1rem",
+    "border-left": "4px solid #10B981",
+    "color": "#E2E8F0",
+    "margin-bottom": "1rem"
+}
+
+_RED_MESSAGE_STYLE = {
+    "background": "linear-gradient(135deg, #7F1D1D 0%, #B91C1C 100%)",
+    "border-radius": "8px",
+    "padding": "1rem",
+    "border-left": "4px solid #EF4444",
+    "color": "#E2E8F0",
+    "margin-bottom": "1rem"
+}
+
+_BLUE_MESSAGE_STYLE = {
+    "background": "linear-gradient(135deg, #1E3A8A 0%, #1D4ED8 100%)",
+    "border-radius": "8px",
+    "padding": "1rem",
+    "border-left": "4px solid #3B82F6",
+    "color": "#E2E8F0",
+    "margin-bottom": "1rem"
+}
+
+
+# Report labels listed under "Completed Reports" in the partial decision summary
+_AVAILABLE_REPORT_LABELS = [
+    ("market_report", "Market Analysis"),
+    ("sentiment_report", "Social Media Sentiment"),
+    ("news_report", "News Analysis"),
+    ("fundamentals_report", "Fundamentals Analysis"),
+    ("macro_report", "Macro Analysis"),
+    ("research_manager_report", "Research Manager Decision"),
+    ("trader_investment_plan", "Trader Investment Plan")
+]
+
+# Reports shown in the analysis tabs, and the analysts whose status decides how each analyst report is shown
+_TAB_REPORT_TYPES = (
+    "market_report",
+    "sentiment_report",
+    "news_report",
+    "fundamentals_report",
+    "macro_report",
+    "research_manager_report",
+    "trader_investment_plan",
+    "final_trade_decision"
+)
+
+_ANALYST_REPORT_AGENTS = {
+    "market_report": "Market Analyst",
+    "sentiment_report": "Social Analyst",
+    "news_report": "News Analyst",
+    "fundamentals_report": "Fundamentals Analyst",
+    "macro_report": "Macro Analyst"
+}
+
+# Status messages for analyst reports, formatted once from their display labels
+_REPORT_LABELS = {
+    "market_report": "Market Report",
+    "sentiment_report": "Sentiment Report",
+    "news_report": "News Report",
+    "fundamentals_report": "Fundamentals Report",
+    "macro_report": "Macro Report"
+}
+
+_IN_PROGRESS_MESSAGES = {
+    report_type: f"🔄 {label} - Analysis in progress..." for report_type, label in _REPORT_LABELS.items()
+}
+
+_PENDING_MESSAGES = {
+    report_type: f"⏳ {label} - Waiting to start..." for report_type, label in _REPORT_LABELS.items()
+}
+
+_NOT_AVAILABLE_MESSAGES = {
+    report_type: f"No {label} available yet." for report_type, label in _REPORT_LABELS.items()
+}
+
+# Last rendered debate per (debate field, symbol) as (debate key, content)
+_debate_cache = {}
 
 
 def create_symbol_button(symbol, index, is_active=False):
@@ -22,6 +133,32 @@ def create_symbol_button(symbol, index, is_active=False):
     )
 
 
+def create_report_symbol_pagination():
+    """Build the symbol pagination buttons for reports"""
+    if not app_state.symbol_states:
+        return html.Div("No symbols available", 
+                        className="text-muted text-center",
+                        style={"padding": "10px"})
+    
+    symbols = app_state.symbols_list()
+    active_index = app_state.symbol_to_index.get(app_state.current_symbol, 0)
+    buttons = [create_symbol_button(symbol, i, i == active_index) for i, symbol in enumerate(symbols)]
+    
+    if len(symbols) > 1:
+        # Add navigation info
+        nav_info = html.Div([
+            html.I(className="fas fa-info-circle me-2"),
+            f"Showing {len(symbols)} symbols"
+        ], className="text-muted small text-center mt-2")
+        
+        return html.Div([
+            dbc.ButtonGroup(buttons, className="d-flex flex-wrap justify-content-center"),
+            nav_info
+        ], className="symbol-pagination-wrapper")
+    else:
+        return dbc.ButtonGroup(buttons, className="d-flex justify-content-center")
+
+
 def create_markdown_content(content, default_message="No content available yet.", report_type=None):
     """Create a markdown component with enhanced styling and conditional prompt button"""
     has_content = content and content.strip() != "" and content != default_message
@@ -56,22 +193,11 @@ def create_markdown_content(content, default_message="No content available yet."
         highlight_config={"theme": "dark"},
         dangerously_allow_html=False,
         className='enhanced-markdown-content',
-        style={
-            "background": "linear-gradient(135deg, #0F172A 0%, #1E293B 100%)",
-            "border-radius": "8px",
-            "padding": "1.5rem",
-            "border": "1px solid rgba(51, 65, 85, 0.3)",
-            "min-height": "1000px",
-            "color": "#E2E8F0",
-            "line-height": "1.6"
-        }
+        style=_MD_STYLE
     )
     
     # If we have actual content and a report type, add a prompt button
     if has_content and not is_loading_message and report_type:
-        from webui.components.prompt_modal import create_show_prompt_button
-        from webui.components.tool_outputs_modal import create_show_tool_outputs_button
-        
         return html.Div([
             html.Div([
                 html.Div([
@@ -85,209 +211,61 @@ def create_markdown_content(content, default_message="No content available yet."
     return markdown_component
 
 
-def register_report_callbacks(app):
-    """Register all report-related callbacks including symbol pagination"""
+@functools.lru_cache(maxsize=32)
+def placeholder_markdown(message):
+    """Shared markdown component for an empty report showing a placeholder message"""
+    return create_markdown_content("", message)
 
-    @app.callback(
-        Output("report-pagination-container", "children"),
-        [Input("app-store", "data"),
-         Input("refresh-interval", "n_intervals")]
-    )
-    def update_report_symbol_pagination(store_data, n_intervals):
-        """Update the symbol pagination buttons for reports"""
-        if not app_state.symbol_states:
-            return html.Div("No symbols available", 
-                          className="text-muted text-center",
-                          style={"padding": "10px"})
-        
-        symbols = list(app_state.symbol_states.keys())
-        current_symbol = app_state.current_symbol
-        
-        # Find active symbol index
-        active_index = 0
-        if current_symbol and current_symbol in symbols:
-            active_index = symbols.index(current_symbol)
-        
-        buttons = []
-        for i, symbol in enumerate(symbols):
-            is_active = i == active_index
-            buttons.append(create_symbol_button(symbol, i, is_active))
-        
-        if len(symbols) > 1:
-            # Add navigation info
-            nav_info = html.Div([
-                html.I(className="fas fa-info-circle me-2"),
-                f"Showing {len(symbols)} symbols"
-            ], className="text-muted small text-center mt-2")
-            
-            return html.Div([
-                dbc.ButtonGroup(buttons, className="d-flex flex-wrap justify-content-center"),
-                nav_info
-            ], className="symbol-pagination-wrapper")
-        else:
-            return dbc.ButtonGroup(buttons, className="d-flex justify-content-center")
 
-    @app.callback(
-        [Output("report-pagination", "active_page", allow_duplicate=True),
-         Output("chart-pagination", "active_page", allow_duplicate=True),
-         Output("report-pagination-container", "children", allow_duplicate=True)],
-        [Input({"type": "symbol-btn", "index": ALL, "component": "reports"}, "n_clicks")],
-        prevent_initial_call=True
-    )
-    def handle_report_symbol_click(symbol_clicks):
-        """Handle symbol button clicks for reports with immediate visual feedback"""
-        if not any(symbol_clicks) or not ctx.triggered:
-            return dash.no_update, dash.no_update, dash.no_update
-        
-        # Find which button was clicked
-        button_id = ctx.triggered[0]["prop_id"]
-        if "symbol-btn" in button_id:
-            # Extract index from the button ID
-            import json
-            button_data = json.loads(button_id.split('.')[0])
-            clicked_index = button_data["index"]
-            
-            # Update current symbol
-            symbols = list(app_state.symbol_states.keys())
-            if 0 <= clicked_index < len(symbols):
-                app_state.current_symbol = symbols[clicked_index]
-                page_number = clicked_index + 1
-                
-                # ⚡ IMMEDIATE BUTTON UPDATE - No waiting for refresh!
-                buttons = []
-                for i, symbol in enumerate(symbols):
-                    is_active = i == clicked_index  # Active state based on click
-                    buttons.append(create_symbol_button(symbol, i, is_active))
-                
-                if len(symbols) > 1:
-                    # Add navigation info
-                    nav_info = html.Div([
-                        html.I(className="fas fa-info-circle me-2"),
-                        f"Showing {len(symbols)} symbols"
-                    ], className="text-muted small text-center mt-2")
-                    
-                    button_container = html.Div([
-                        dbc.ButtonGroup(buttons, className="d-flex flex-wrap justify-content-center"),
-                        nav_info
-                    ], className="symbol-pagination-wrapper")
-                else:
-                    button_container = dbc.ButtonGroup(buttons, className="d-flex justify-content-center")
-                
-                return page_number, page_number, button_container
-        
-        return dash.no_update, dash.no_update, dash.no_update
+# Prebuilt outputs of update_all_symbol_views for the states without symbol data, reused on every tick
+_OUT_OF_RANGE_MESSAGE = "Page index out of range. Please refresh or restart analysis."
 
-    @app.callback(
-        Output("researcher-debate-tab-content", "children"),
-        [Input("report-pagination", "active_page"),
-         Input("medium-refresh-interval", "n_intervals")]
-    )
-    def update_researcher_debate(active_page, n_intervals):
-        """Update the researcher debate tab with Dash components and prompt buttons"""
-        if not app_state.symbol_states or not active_page:
-            return create_markdown_content("", "No researcher debate available yet.")
+_NO_ANALYSIS_VIEWS = (
+    placeholder_markdown("No researcher debate available yet."),
+    placeholder_markdown("No risk debate available yet."),
+    *(placeholder_markdown("No analysis available yet."),) * 8,
+    "Analysis not complete yet.",
+    {}
+)
 
-        # Safeguard against accessing invalid page index (e.g., after page refresh)
-        symbols_list = list(app_state.symbol_states.keys())
-        if active_page > len(symbols_list):
-            return create_markdown_content("", "Page index out of range. Please refresh or restart analysis.")
+_OUT_OF_RANGE_VIEWS = (
+    *(placeholder_markdown(_OUT_OF_RANGE_MESSAGE),) * 10,
+    _OUT_OF_RANGE_MESSAGE,
+    {}
+)
 
-        symbol = symbols_list[active_page - 1]
-        state = app_state.get_state(symbol)
-        
-        if not state:
-            return create_markdown_content("", f"No active analysis for {symbol}. Researcher debate will appear here once analysis starts.")
+_NO_SYMBOL_DATA_TABS = (placeholder_markdown("No data for this symbol."),) * 8
 
-        # Get the debate state
-        debate_state = state.get("investment_debate_state")
-        
-        if not debate_state or not debate_state.get("history"):
-            return create_markdown_content("", "Researcher debate will begin once analysis starts.")
+_UNCHANGED_TABS = (dash.no_update,) * 8
 
-        debate_components = []
-        
-        # Get message arrays for proper conversation display
-        bull_messages = debate_state.get("bull_messages", [])
-        bear_messages = debate_state.get("bear_messages", [])
+# Largest integer a browser store holds exactly (2**53 - 1)
+_JS_SAFE_INT_MASK = (1 << 53) - 1
+
+
+def create_researcher_debate_content(debate_state):
+    """Build the researcher debate tab from the investment debate state with Dash components and prompt buttons"""
+    if not debate_state or not debate_state.get("history"):
+        return placeholder_markdown("Researcher debate will begin once analysis starts.")
+
+    debate_components = []
+    
+    # Get message arrays for proper conversation display
+    bull_messages = debate_state.get("bull_messages", [])
+    bear_messages = debate_state.get("bear_messages", [])
+    
+    # Create conversation-style debate display
+    if bull_messages or bear_messages:
+        # Interleave messages chronologically based on debate flow
+        # Usually: Bull -> Bear -> Bull -> Bear, etc.
+        max_messages = max(len(bull_messages), len(bear_messages))
         
-        # Create conversation-style debate display
-        if bull_messages or bear_messages:
-            from webui.components.prompt_modal import create_show_prompt_button
-            
-            # Interleave messages chronologically based on debate flow
-            # Usually: Bull -> Bear -> Bull -> Bear, etc.
-            max_messages = max(len(bull_messages), len(bear_messages))
-            
-            for i in range(max_messages):
-                # Add Bull message if available
-                if i < len(bull_messages):
-                    bull_message = bull_messages[i]
-                    # Remove the "Bull Analyst: " prefix for cleaner display
-                    clean_bull_message = bull_message.replace("Bull Analyst: ", "")
-                    
-                    bull_section = html.Div([
-                        html.Div([
-                            html.Div([
-                                html.Span("🐂 Bull Researcher", className="me-2", style={"fontWeight": "bold", "color": "#10B981"}),
-                                create_show_prompt_button("bull_report")
-                            ], className="d-flex justify-content-between align-items-center mb-2")
-                        ]),
-                        dcc.Markdown(
-                            clean_bull_message,
-                            mathjax=True,
-                            highlight_config={"theme": "dark"},
-                            dangerously_allow_html=False,
-                            className='enhanced-markdown-content',
-                            style={
-                                "background": "linear-gradient(135deg, #064E3B 0%, #047857 100%)",
-                                "border-radius": "8px",
-                                "padding": "1rem",
-                                "border-left": "4px solid #10B981",
-                                "color": "#E2E8F0",
-                                "margin-bottom": "1rem"
-                            }
-                        )
-                    ])
-                    debate_components.append(bull_section)
+        for i in range(max_messages):
+            # Add Bull message if available
+            if i < len(bull_messages):
+                bull_message = bull_messages[i]
+                # Remove the "Bull Analyst: " prefix for cleaner display
+                clean_bull_message = bull_message.replace("Bull Analyst: ", "")
                 
-                # Add Bear message if available
-                if i < len(bear_messages):
-                    bear_message = bear_messages[i]
-                    # Remove the "Bear Analyst: " prefix for cleaner display
-                    clean_bear_message = bear_message.replace("Bear Analyst: ", "")
-                    
-                    bear_section = html.Div([
-                        html.Div([
-                            html.Div([
-                                html.Span("🐻 Bear Researcher", className="me-2", style={"fontWeight": "bold", "color": "#EF4444"}),
-                                create_show_prompt_button("bear_report")
-                            ], className="d-flex justify-content-between align-items-center mb-2")
-                        ]),
-                        dcc.Markdown(
-                            clean_bear_message,
-                            mathjax=True,
-                            highlight_config={"theme": "dark"},
-                            dangerously_allow_html=False,
-                            className='enhanced-markdown-content',
-                            style={
-                                "background": "linear-gradient(135deg, #7F1D1D 0%, #B91C1C 100%)",
-                                "border-radius": "8px",
-                                "padding": "1rem",
-                                "border-left": "4px solid #EF4444",
-                                "color": "#E2E8F0",
-                                "margin-bottom": "1rem"
-                            }
-                        )
-                    ])
-                    debate_components.append(bear_section)
-        
-        # Fallback to old format if new message arrays don't exist
-        elif debate_state.get("bull_history") or debate_state.get("bear_history"):
-            from webui.components.prompt_modal import create_show_prompt_button
-            
-            # Add Bull Researcher section if available
-            bull_history = debate_state.get("bull_history", "")
-            if bull_history and bull_history.strip():
                 bull_section = html.Div([
                     html.Div([
                         html.Div([
@@ -296,26 +274,22 @@ def register_report_callbacks(app):
                         ], className="d-flex justify-content-between align-items-center mb-2")
                     ]),
                     dcc.Markdown(
-                        bull_history,
+                        clean_bull_message,
                         mathjax=True,
                         highlight_config={"theme": "dark"},
                         dangerously_allow_html=False,
                         className='enhanced-markdown-content',
-                        style={
-                            "background": "linear-gradient(135deg, #064E3B 0%, #047857 100%)",
-                            "border-radius": "8px",
-                            "padding": "1rem",
-                            "border-left": "4px solid #10B981",
-                            "color": "#E2E8F0",
-                            "margin-bottom": "1rem"
-                        }
+                        style=_GREEN_MESSAGE_STYLE
                     )
                 ])
                 debate_components.append(bull_section)
             
-            # Add Bear Researcher section if available  
-            bear_history = debate_state.get("bear_history", "")
-            if bear_history and bear_history.strip():
+            # Add Bear message if available
+            if i < len(bear_messages):
+                bear_message = bear_messages[i]
+                # Remove the "Bear Analyst: " prefix for cleaner display
+                clean_bear_message = bear_message.replace("Bear Analyst: ", "")
+                
                 bear_section = html.Div([
                     html.Div([
                         html.Div([
@@ -324,181 +298,94 @@ def register_report_callbacks(app):
                         ], className="d-flex justify-content-between align-items-center mb-2")
                     ]),
                     dcc.Markdown(
-                        bear_history,
+                        clean_bear_message,
                         mathjax=True,
                         highlight_config={"theme": "dark"},
                         dangerously_allow_html=False,
                         className='enhanced-markdown-content',
-                        style={
-                            "background": "linear-gradient(135deg, #7F1D1D 0%, #B91C1C 100%)",
-                            "border-radius": "8px",
-                            "padding": "1rem",
-                            "border-left": "4px solid #EF4444",
-                            "color": "#E2E8F0",
-                            "margin-bottom": "1rem"
-                        }
+                        style=_RED_MESSAGE_STYLE
                     )
                 ])
                 debate_components.append(bear_section)
+    
+    # Fallback to old format if new message arrays don't exist
+    elif debate_state.get("bull_history") or debate_state.get("bear_history"):
+        # Add Bull Researcher section if available
+        bull_history = debate_state.get("bull_history", "")
+        if bull_history and bull_history.strip():
+            bull_section = html.Div([
+                html.Div([
+                    html.Div([
+                        html.Span("🐂 Bull Researcher", className="me-2", style={"fontWeight": "bold", "color": "#10B981"}),
+                        create_show_prompt_button("bull_report")
+                    ], className="d-flex justify-content-between align-items-center mb-2")
+                ]),
+                dcc.Markdown(
+                    bull_history,
+                    mathjax=True,
+                    highlight_config={"theme": "dark"},
+                    dangerously_allow_html=False,
+                    className='enhanced-markdown-content',
+                    style=_GREEN_MESSAGE_STYLE
+                )
+            ])
+            debate_components.append(bull_section)
         
-        if not debate_components:
-            return create_markdown_content("", "Researcher debate will begin once analysis starts.")
-        
-        return html.Div(
-            debate_components,
-            style={
-                "background": "linear-gradient(135deg, #0F172A 0%, #1E293B 100%)",
-                "border-radius": "8px",
-                "padding": "1.5rem",
-                "min-height": "1000px",
-                "maxHeight": "600px",
-                "overflowY": "auto"
-            }
-        )
-
-    @app.callback(
-        Output("risk-debate-tab-content", "children"),
-        [Input("report-pagination", "active_page"),
-         Input("medium-refresh-interval", "n_intervals")]
+        # Add Bear Researcher section if available  
+        bear_history = debate_state.get("bear_history", "")
+        if bear_history and bear_history.strip():
+            bear_section = html.Div([
+                html.Div([
+                    html.Div([
+                        html.Span("🐻 Bear Researcher", className="me-2", style={"fontWeight": "bold", "color": "#EF4444"}),
+                        create_show_prompt_button("bear_report")
+                    ], className="d-flex justify-content-between align-items-center mb-2")
+                ]),
+                dcc.Markdown(
+                    bear_history,
+                    mathjax=True,
+                    highlight_config={"theme": "dark"},
+                    dangerously_allow_html=False,
+                    className='enhanced-markdown-content',
+                    style=_RED_MESSAGE_STYLE
+                )
+            ])
+            debate_components.append(bear_section)
+    
+    if not debate_components:
+        return placeholder_markdown("Researcher debate will begin once analysis starts.")
+    
+    return html.Div(
+        debate_components,
+        style=_DEBATE_CONTAINER_STYLE
     )
-    def update_risk_debate(active_page, n_intervals):
-        """Update the risk debate tab with Dash components and prompt buttons"""
-        if not app_state.symbol_states or not active_page:
-            return create_markdown_content("", "No risk debate available yet.")
-
-        # Safeguard against accessing invalid page index (e.g., after page refresh)
-        symbols_list = list(app_state.symbol_states.keys())
-        if active_page > len(symbols_list):
-            return create_markdown_content("", "Page index out of range. Please refresh or restart analysis.")
 
-        symbol = symbols_list[active_page - 1]
-        state = app_state.get_state(symbol)
-        
-        if not state:
-            return create_markdown_content("", f"No active analysis for {symbol}. Risk debate will appear here once analysis starts.")
 
-        # Get the risk debate state
-        risk_debate_state = state.get("risk_debate_state")
-        
-        if not risk_debate_state or not risk_debate_state.get("history"):
-            return create_markdown_content("", "Risk debate will begin once analysis starts.")
+def create_risk_debate_content(risk_debate_state):
+    """Build the risk debate tab from the risk debate state with Dash components and prompt buttons"""
+    if not risk_debate_state or not risk_debate_state.get("history"):
+        return placeholder_markdown("Risk debate will begin once analysis starts.")
 
-        debate_components = []
-        
-        # Get message arrays for proper conversation display
-        risky_messages = risk_debate_state.get("risky_messages", [])
-        safe_messages = risk_debate_state.get("safe_messages", [])
-        neutral_messages = risk_debate_state.get("neutral_messages", [])
+    debate_components = []
+    
+    # Get message arrays for proper conversation display
+    risky_messages = risk_debate_state.get("risky_messages", [])
+    safe_messages = risk_debate_state.get("safe_messages", [])
+    neutral_messages = risk_debate_state.get("neutral_messages", [])
+    
+    # Create conversation-style debate display
+    if risky_messages or safe_messages or neutral_messages:
+        # Interleave messages chronologically based on debate flow
+        # Usually: Risky -> Safe -> Neutral -> Risky -> Safe -> Neutral, etc.
+        max_messages = max(len(risky_messages), len(safe_messages), len(neutral_messages))
         
-        # Create conversation-style debate display
-        if risky_messages or safe_messages or neutral_messages:
-            from webui.components.prompt_modal import create_show_prompt_button
-            
-            # Interleave messages chronologically based on debate flow
-            # Usually: Risky -> Safe -> Neutral -> Risky -> Safe -> Neutral, etc.
-            max_messages = max(len(risky_messages), len(safe_messages), len(neutral_messages))
-            
-            for i in range(max_messages):
-                # Add Risky message if available
-                if i < len(risky_messages):
-                    risky_message = risky_messages[i]
-                    # Remove the "Risky Analyst: " prefix for cleaner display
-                    clean_risky_message = risky_message.replace("Risky Analyst: ", "")
-                    
-                    risky_section = html.Div([
-                        html.Div([
-                            html.Div([
-                                html.Span("⚡ Risky Analyst", className="me-2", style={"fontWeight": "bold", "color": "#EF4444"}),
-                                create_show_prompt_button("aggressive_report")
-                            ], className="d-flex justify-content-between align-items-center mb-2")
-                        ]),
-                        dcc.Markdown(
-                            clean_risky_message,
-                            mathjax=True,
-                            highlight_config={"theme": "dark"},
-                            dangerously_allow_html=False,
-                            className='enhanced-markdown-content',
-                            style={
-                                "background": "linear-gradient(135deg, #7F1D1D 0%, #B91C1C 100%)",
-                                "border-radius": "8px",
-                                "padding": "1rem",
-                                "border-left": "4px solid #EF4444",
-                                "color": "#E2E8F0",
-                                "margin-bottom": "1rem"
-                            }
-                        )
-                    ])
-                    debate_components.append(risky_section)
+        for i in range(max_messages):
+            # Add Risky message if available
+            if i < len(risky_messages):
+                risky_message = risky_messages[i]
+                # Remove the "Risky Analyst: " prefix for cleaner display
+                clean_risky_message = risky_message.replace("Risky Analyst: ", "")
                 
-                # Add Safe message if available
-                if i < len(safe_messages):
-                    safe_message = safe_messages[i]
-                    # Remove the "Safe Analyst: " prefix for cleaner display
-                    clean_safe_message = safe_message.replace("Safe Analyst: ", "")
-                    
-                    safe_section = html.Div([
-                        html.Div([
-                            html.Div([
-                                html.Span("🛡️ Safe Analyst", className="me-2", style={"fontWeight": "bold", "color": "#10B981"}),
-                                create_show_prompt_button("conservative_report")
-                            ], className="d-flex justify-content-between align-items-center mb-2")
-                        ]),
-                        dcc.Markdown(
-                            clean_safe_message,
-                            mathjax=True,
-                            highlight_config={"theme": "dark"},
-                            dangerously_allow_html=False,
-                            className='enhanced-markdown-content',
-                            style={
-                                "background": "linear-gradient(135deg, #064E3B 0%, #047857 100%)",
-                                "border-radius": "8px",
-                                "padding": "1rem",
-                                "border-left": "4px solid #10B981",
-                                "color": "#E2E8F0",
-                                "margin-bottom": "1rem"
-                            }
-                        )
-                    ])
-                    debate_components.append(safe_section)
-                
-                # Add Neutral message if available
-                if i < len(neutral_messages):
-                    neutral_message = neutral_messages[i]
-                    # Remove the "Neutral Analyst: " prefix for cleaner display
-                    clean_neutral_message = neutral_message.replace("Neutral Analyst: ", "")
-                    
-                    neutral_section = html.Div([
-                        html.Div([
-                            html.Div([
-                                html.Span("⚖️ Neutral Analyst", className="me-2", style={"fontWeight": "bold", "color": "#3B82F6"}),
-                                create_show_prompt_button("neutral_report")
-                            ], className="d-flex justify-content-between align-items-center mb-2")
-                        ]),
-                        dcc.Markdown(
-                            clean_neutral_message,
-                            mathjax=True,
-                            highlight_config={"theme": "dark"},
-                            dangerously_allow_html=False,
-                            className='enhanced-markdown-content',
-                            style={
-                                "background": "linear-gradient(135deg, #1E3A8A 0%, #1D4ED8 100%)",
-                                "border-radius": "8px",
-                                "padding": "1rem",
-                                "border-left": "4px solid #3B82F6",
-                                "color": "#E2E8F0",
-                                "margin-bottom": "1rem"
-                            }
-                        )
-                    ])
-                    debate_components.append(neutral_section)
-        
-        # Fallback to old format if new message arrays don't exist
-        elif risk_debate_state.get("risky_history") or risk_debate_state.get("safe_history") or risk_debate_state.get("neutral_history"):
-            from webui.components.prompt_modal import create_show_prompt_button
-            
-            # Add Risky/Aggressive section if available
-            risky_history = risk_debate_state.get("risky_history", "")
-            if risky_history and risky_history.strip():
                 risky_section = html.Div([
                     html.Div([
                         html.Div([
@@ -507,26 +394,22 @@ def register_report_callbacks(app):
                         ], className="d-flex justify-content-between align-items-center mb-2")
                     ]),
                     dcc.Markdown(
-                        risky_history,
+                        clean_risky_message,
                         mathjax=True,
                         highlight_config={"theme": "dark"},
                         dangerously_allow_html=False,
                         className='enhanced-markdown-content',
-                        style={
-                            "background": "linear-gradient(135deg, #7F1D1D 0%, #B91C1C 100%)",
-                            "border-radius": "8px",
-                            "padding": "1rem",
-                            "border-left": "4px solid #EF4444",
-                            "color": "#E2E8F0",
-                            "margin-bottom": "1rem"
-                        }
+                        style=_RED_MESSAGE_STYLE
                     )
                 ])
                 debate_components.append(risky_section)
             
-            # Add Safe/Conservative section if available  
-            safe_history = risk_debate_state.get("safe_history", "")
-            if safe_history and safe_history.strip():
+            # Add Safe message if available
+            if i < len(safe_messages):
+                safe_message = safe_messages[i]
+                # Remove the "Safe Analyst: " prefix for cleaner display
+                clean_safe_message = safe_message.replace("Safe Analyst: ", "")
+                
                 safe_section = html.Div([
                     html.Div([
                         html.Div([
@@ -535,26 +418,22 @@ def register_report_callbacks(app):
                         ], className="d-flex justify-content-between align-items-center mb-2")
                     ]),
                     dcc.Markdown(
-                        safe_history,
+                        clean_safe_message,
                         mathjax=True,
                         highlight_config={"theme": "dark"},
                         dangerously_allow_html=False,
                         className='enhanced-markdown-content',
-                        style={
-                            "background": "linear-gradient(135deg, #064E3B 0%, #047857 100%)",
-                            "border-radius": "8px",
-                            "padding": "1rem",
-                            "border-left": "4px solid #10B981",
-                            "color": "#E2E8F0",
-                            "margin-bottom": "1rem"
-                        }
+                        style=_GREEN_MESSAGE_STYLE
                     )
                 ])
                 debate_components.append(safe_section)
             
-            # Add Neutral section if available
-            neutral_history = risk_debate_state.get("neutral_history", "")
-            if neutral_history and neutral_history.strip():
+            # Add Neutral message if available
+            if i < len(neutral_messages):
+                neutral_message = neutral_messages[i]
+                # Remove the "Neutral Analyst: " prefix for cleaner display
+                clean_neutral_message = neutral_message.replace("Neutral Analyst: ", "")
+                
                 neutral_section = html.Div([
                     html.Div([
                         html.Div([
@@ -563,245 +442,427 @@ def register_report_callbacks(app):
                         ], className="d-flex justify-content-between align-items-center mb-2")
                     ]),
                     dcc.Markdown(
-                        neutral_history,
+                        clean_neutral_message,
                         mathjax=True,
                         highlight_config={"theme": "dark"},
                         dangerously_allow_html=False,
                         className='enhanced-markdown-content',
-                        style={
-                            "background": "linear-gradient(135deg, #1E3A8A 0%, #1D4ED8 100%)",
-                            "border-radius": "8px",
-                            "padding": "1rem",
-                            "border-left": "4px solid #3B82F6",
-                            "color": "#E2E8F0",
-                            "margin-bottom": "1rem"
-                        }
+                        style=_BLUE_MESSAGE_STYLE
                     )
                 ])
                 debate_components.append(neutral_section)
+    
+    # Fallback to old format if new message arrays don't exist
+    elif risk_debate_state.get("risky_history") or risk_debate_state.get("safe_history") or risk_debate_state.get("neutral_history"):
+        # Add Risky/Aggressive section if available
+        risky_history = risk_debate_state.get("risky_history", "")
+        if risky_history and risky_history.strip():
+            risky_section = html.Div([
+                html.Div([
+                    html.Div([
+                        html.Span("⚡ Risky Analyst", className="me-2", style={"fontWeight": "bold", "color": "#EF4444"}),
+                        create_show_prompt_button("aggressive_report")
+                    ], className="d-flex justify-content-between align-items-center mb-2")
+                ]),
+                dcc.Markdown(
+                    risky_history,
+                    mathjax=True,
+                    highlight_config={"theme": "dark"},
+                    dangerously_allow_html=False,
+                    className='enhanced-markdown-content',
+                    style=_RED_MESSAGE_STYLE
+                )
+            ])
+            debate_components.append(risky_section)
         
-        if not debate_components:
-            return create_markdown_content("", "Risk debate will begin once analysis starts.")
+        # Add Safe/Conservative section if available  
+        safe_history = risk_debate_state.get("safe_history", "")
+        if safe_history and safe_history.strip():
+            safe_section = html.Div([
+                html.Div([
+                    html.Div([
+                        html.Span("🛡️ Safe Analyst", className="me-2", style={"fontWeight": "bold", "color": "#10B981"}),
+                        create_show_prompt_button("conservative_report")
+                    ], className="d-flex justify-content-between align-items-center mb-2")
+                ]),
+                dcc.Markdown(
+                    safe_history,
+                    mathjax=True,
+                    highlight_config={"theme": "dark"},
+                    dangerously_allow_html=False,
+                    className='enhanced-markdown-content',
+                    style=_GREEN_MESSAGE_STYLE
+                )
+            ])
+            debate_components.append(safe_section)
         
-        return html.Div(
-            debate_components,
-            style={
-                "background": "linear-gradient(135deg, #0F172A 0%, #1E293B 100%)",
-                "border-radius": "8px",
-                "padding": "1.5rem",
-                "min-height": "1000px",
-                "maxHeight": "600px",
-                "overflowY": "auto"
-            }
-        )
-
-    @app.callback(
-        [Output("market-analysis-tab-content", "children"),
-         Output("social-sentiment-tab-content", "children"),
-         Output("news-analysis-tab-content", "children"),
-         Output("fundamentals-analysis-tab-content", "children"),
-         Output("macro-analysis-tab-content", "children"),
-         Output("research-manager-tab-content", "children"),
-         Output("trader-plan-tab-content", "children"),
-         Output("final-decision-tab-content", "children")],
-        [Input("report-pagination", "active_page"),
-         Input("medium-refresh-interval", "n_intervals")]
+        # Add Neutral section if available
+        neutral_history = risk_debate_state.get("neutral_history", "")
+        if neutral_history and neutral_history.strip():
+            neutral_section = html.Div([
+                html.Div([
+                    html.Div([
+                        html.Span("⚖️ Neutral Analyst", className="me-2", style={"fontWeight": "bold", "color": "#3B82F6"}),
+                        create_show_prompt_button("neutral_report")
+                    ], className="d-flex justify-content-between align-items-center mb-2")
+                ]),
+                dcc.Markdown(
+                    neutral_history,
+                    mathjax=True,
+                    highlight_config={"theme": "dark"},
+                    dangerously_allow_html=False,
+                    className='enhanced-markdown-content',
+                    style=_BLUE_MESSAGE_STYLE
+                )
+            ])
+            debate_components.append(neutral_section)
+    
+    if not debate_components:
+        return placeholder_markdown("Risk debate will begin once analysis starts.")
+    
+    return html.Div(
+        debate_components,
+        style=_DEBATE_CONTAINER_STYLE
     )
-    def update_tabs_content(active_page, n_intervals):
-        """Update the content of all tabs with validation to ensure complete reports"""
-        # print(f"[REPORTS] Called with active_page={active_page}, symbol_states={list(app_state.symbol_states.keys()) if app_state.symbol_states else []}")
-        
-        if not app_state.symbol_states or not active_page:
-            # print(f"[REPORTS] No symbol states or no active page, returning default content")
-            return [create_markdown_content("", "No analysis available yet.")] * 8
-        
-        # Safeguard against accessing invalid page index (e.g., after page refresh)
-        symbols_list = list(app_state.symbol_states.keys())
-        if active_page > len(symbols_list):
-            return [create_markdown_content("", "Page index out of range. Please refresh or restart analysis.")] * 8
-        
-        symbol = symbols_list[active_page - 1]
-        # print(f"[REPORTS] Selected symbol: {symbol} (page {active_page})")
-        state = app_state.get_state(symbol)
+
+
+def debate_message_order(debate_state, message_fields):
+    """Display order of debate messages as [message field, index] pairs, one round at a time"""
+    message_lists = [debate_state.get(field) or [] for field in message_fields]
+    max_messages = max(len(messages) for messages in message_lists)
+    return [
+        [field, i]
+        for i in range(max_messages)
+        for field, messages in zip(message_fields, message_lists)
+        if i < len(messages)
+    ]
+
+
+def get_debate_content(symbol, state, debate_field, create_content, message_fields):
+    """Get a debate tab with its version key and message order, reusing the last render while the debate is unchanged
+
+    The debate state is read once so the content, key and message order always describe the same debate,
+    even when the analysis thread replaces it mid-render.
+    """
+    debate_state = state.get(debate_field) or {}
+    debate_key = [symbol, state.get("session_id"), len(debate_state.get("history") or "")]
+
+    cached = _debate_cache.get((debate_field, symbol))
+    if cached and cached[0] == debate_key:
+        return cached
+
+    content = create_content(debate_state)
+    # Only the conversation view (a Div with one section per message) can be extended message by message,
+    # so a cached order always matches the sections rendered under the same key
+    message_order = []
+    if isinstance(content, html.Div):
+        message_order = debate_message_order(debate_state, message_fields)
+        if len(message_order) != len(content.children):
+            message_order = []
+    _debate_cache[(debate_field, symbol)] = (debate_key, content, message_order)
+    return debate_key, content, message_order
+
+
+def get_debate_update(symbol, state, debate_field, create_content, message_fields,
+                      last_views_key, views_key, is_refresh_tick):
+    """Get the debate tab output - full content, a Patch appending new messages, or no_update
+
+    last_views_key holds the debate key and message order this browser last received;
+    the ones sent now are recorded in views_key.
+    """
+    debate_key, content, message_order = get_debate_content(symbol, state, debate_field, create_content, message_fields)
+    last_key, last_order = last_views_key.get(debate_field) or (None, [])
+    views_key[debate_field] = [debate_key, message_order]
+
+    if not is_refresh_tick or last_key is None:
+        return content
+    if debate_key == last_key:
+        return dash.no_update
+
+    # Same session with new messages appended - send only the new sections instead of the whole debate
+    if last_order and last_key[:2] == debate_key[:2] and message_order[:len(last_order)] == last_order:
+        new_sections = content.children[len(last_order):]
+        if not new_sections:
+            return dash.no_update
+        patched_debate = Patch()
+        patched_debate["props"]["children"].extend(new_sections)
+        return patched_debate
+
+    return content
+
+
+def analysis_tabs_fingerprint(symbol, state):
+    """JSON-safe fingerprint of everything the analysis tabs are rendered from
+
+    Reports are reduced to their string hash (cached on the string) masked to fit a JavaScript number.
+    """
+    reports = state["current_reports"]
+    agent_statuses = state["agent_statuses"]
+    return [
+        symbol,
+        [
+            None if report is None else hash(report) & _JS_SAFE_INT_MASK
+            for report in (reports.get(report_type) for report_type in _TAB_REPORT_TYPES)
+        ],
+        [agent_statuses.get(agent) for agent in _ANALYST_REPORT_AGENTS.values()]
+    ]
+
+
+def create_analysis_tabs_content(state):
+    """Build the content of all analysis tabs with validation to ensure complete reports"""
+    reports = state["current_reports"]
+    agent_statuses = state["agent_statuses"]
+    
+    # 🛡️ VALIDATION: Only show complete reports in UI
+    # For analysts marked as "completed", validate reports are actually complete
+    analyst_reports = {report_type: reports.get(report_type) for report_type in _ANALYST_REPORT_AGENTS}
+    
+    # Check which analysts are completed
+    analyst_status_map = {
+        report_type: agent_statuses.get(agent) for report_type, agent in _ANALYST_REPORT_AGENTS.items()
+    }
+    
+    # 🛡️ PRIORITY: Analyst status takes precedence over content validation
+    # If analyst is completed, always show the report regardless of content validation
+    validated_reports = {}
+    unvalidated_reports = {}
+    
+    for report_type, content in analyst_reports.items():
+        status = analyst_status_map.get(report_type)
         
-        if not state:
-            return [create_markdown_content("", "No data for this symbol.")] * 8
+        if status == "completed" and content:
+            # Analyst is done - show the final report
+            validated_reports[report_type] = content
+        elif status == "in_progress":
+            validated_reports[report_type] = _IN_PROGRESS_MESSAGES[report_type]
+        elif status == "pending":
+            validated_reports[report_type] = _PENDING_MESSAGES[report_type]
+        elif content:
+            # Analyst status unknown but we have content - validate it below
+            unvalidated_reports[report_type] = content
+        else:
+            validated_reports[report_type] = _NOT_AVAILABLE_MESSAGES[report_type]
+    
+    # Validate all reports with unknown analyst status in a single pass
+    if unvalidated_reports:
+        validated_reports.update(validate_reports_for_ui(unvalidated_reports))
+    
+    # Get final validated reports or defaults
+    market_report = validated_reports.get("market_report", "No market analysis available yet.")
+    sentiment_report = validated_reports.get("sentiment_report", "No sentiment analysis available yet.")
+    news_report = validated_reports.get("news_report", "No news analysis available yet.")
+    fundamentals_report = validated_reports.get("fundamentals_report", "No fundamentals analysis available yet.")
+    macro_report = validated_reports.get("macro_report", "No macro analysis available yet.")
+    
+    # Research team reports (no validation needed - these come as complete chunks)
+    research_manager_report = reports.get("research_manager_report") or "No research manager decision available yet."
+    trader_report = reports.get("trader_investment_plan") or "No trader report available yet."
+    
+    # Final Decision tab shows the Portfolio Manager Decision
+    portfolio_report = reports.get("final_trade_decision") or "No final decision available yet."
+    
+    return (
+        create_markdown_content(market_report, "No market analysis available yet.", "market_report"),
+        create_markdown_content(sentiment_report, "No sentiment analysis available yet.", "sentiment_report"),
+        create_markdown_content(news_report, "No news analysis available yet.", "news_report"),
+        create_markdown_content(fundamentals_report, "No fundamentals analysis available yet.", "fundamentals_report"),
+        create_markdown_content(macro_report, "No macro analysis available yet.", "macro_report"),
+        create_markdown_content(research_manager_report, "No research manager decision available yet.", "research_manager_report"),
+        create_markdown_content(trader_report, "No trader report available yet.", "trader_investment_plan"),
+        create_markdown_content(portfolio_report, "No final decision available yet.", "final_trade_decision")
+    )
+
+
+def create_decision_summary(state):
+    """Build the decision summary text"""
+    reports = state["current_reports"]
+    final_report_content = reports.get("final_trade_decision")
+
+    # A race condition can occur where the final report is generated but the analysis_complete flag is not yet set.
+    # We should only show the final decision when the state is confirmed as complete.
+    if state.get("analysis_complete") and final_report_content is not None:
+        if state["analysis_results"]:
+            decision_text = f"## Final Decision for {state['ticker_symbol']}\n\n"
+            decision_text += f"**Trade Action:** {state['analysis_results'].get('decision', 'No decision')}\n\n"
+            decision_text += "**Date:** " + state['analysis_results'].get("date", "N/A")
+        else:
+            # Show the recommended action if available
+            decision_text = f"## Final Decision for {state['ticker_symbol']}\n\n"
             
-        reports = state["current_reports"]
-        agent_statuses = state["agent_statuses"]
-        
-        # 🛡️ VALIDATION: Only show complete reports in UI
-        # For analysts marked as "completed", validate reports are actually complete
-        analyst_reports = {
-            "market_report": reports.get("market_report"),
-            "sentiment_report": reports.get("sentiment_report"), 
-            "news_report": reports.get("news_report"),
-            "fundamentals_report": reports.get("fundamentals_report"),
-            "macro_report": reports.get("macro_report")
-        }
-        
-        # Check which analysts are completed
-        analyst_status_map = {
-            "market_report": agent_statuses.get("Market Analyst"),
-            "sentiment_report": agent_statuses.get("Social Analyst"),
-            "news_report": agent_statuses.get("News Analyst"), 
-            "fundamentals_report": agent_statuses.get("Fundamentals Analyst"),
-            "macro_report": agent_statuses.get("Macro Analyst")
-        }
-        
-        # 🛡️ PRIORITY: Analyst status takes precedence over content validation
-        # If analyst is completed, always show the report regardless of content validation
-        validated_reports = {}
-        
-        for report_type, content in analyst_reports.items():
-            status = analyst_status_map.get(report_type)
+            # Display the extracted recommendation prominently
+            if "recommended_action" in state and state["recommended_action"]:
+                decision_text += f"**📈 RECOMMENDED ACTION: {state['recommended_action']}**\n\n"
             
-            if status == "completed" and content:
-                # Analyst is done - show the final report
-                validated_reports[report_type] = content
-            elif status == "in_progress":
-                validated_reports[report_type] = f"🔄 {report_type.replace('_', ' ').title()} - Analysis in progress..."
-            elif status == "pending":
-                validated_reports[report_type] = f"⏳ {report_type.replace('_', ' ').title()} - Waiting to start..."
-            elif content:
-                # Analyst status unknown but we have content - validate it
-                content_validated = validate_reports_for_ui({report_type: content})
-                validated_reports[report_type] = content_validated[report_type]
-            else:
-                validated_reports[report_type] = f"No {report_type.replace('_', ' ').title()} available yet."
-        
-        # Get final validated reports or defaults
-        market_report = validated_reports.get("market_report", "No market analysis available yet.")
-        sentiment_report = validated_reports.get("sentiment_report", "No sentiment analysis available yet.")
-        news_report = validated_reports.get("news_report", "No news analysis available yet.")
-        fundamentals_report = validated_reports.get("fundamentals_report", "No fundamentals analysis available yet.")
-        macro_report = validated_reports.get("macro_report", "No macro analysis available yet.")
+            decision_text += "**Full Analysis:**\n"
+            decision_text += final_report_content
+    else:
+        # Show partial decision summary based on available reports
+        risk_history = (state.get("risk_debate_state") or {}).get("history")
+        available_reports = [label for report_type, label in _AVAILABLE_REPORT_LABELS if reports.get(report_type)]
+        if risk_history:
+            available_reports.append("Risk Debate")
+        if final_report_content is not None:
+            available_reports.append("Portfolio Manager Final Decision")
         
-        # Research team reports (no validation needed - these come as complete chunks)
-        research_manager_report = reports.get("research_manager_report") or "No research manager decision available yet."
-        trader_report = reports.get("trader_investment_plan") or "No trader report available yet."
+        if available_reports:
+            decision_text = f"## Partial Analysis for {state['ticker_symbol']}\n\n"
+            decision_text += "**Completed Reports:** " + ", ".join(available_reports) + "\n\n"
+            
+            # Show the latest available decision as "Current Decision"
+            # Get the last message from risk debate
+            risk_debate_latest = risk_history.split('\n')[-1] if risk_history else ""
+            
+            current_decision = (
+                final_report_content or
+                risk_debate_latest or
+                reports.get("trader_investment_plan") or
+                reports.get("research_manager_report")
+            )
+            
+            if current_decision:
+                decision_text += "**Current Decision:** Based on completed analysis\n\n"
+                decision_text += current_decision
+        else:
+            decision_text = "Analysis not complete yet."
+    
+    return decision_text
+
+
+def register_report_callbacks(app):
+    """Register all report-related callbacks including symbol pagination"""
+
+    @app.callback(
+        [Output("report-pagination-container", "children"),
+         Output("report-pagination-key", "data")],
+        [Input("app-store", "data"),
+         Input("refresh-interval", "n_intervals")],
+        [State("report-pagination-key", "data")]
+    )
+    def update_report_symbol_pagination(store_data, n_intervals, last_pagination_key):
+        """Update the symbol pagination buttons for reports"""
+        # Compare against what this browser last received - skip refresh ticks that would change nothing
+        pagination_key = [app_state.symbols_list(), app_state.current_symbol]
+        if ctx.triggered_id == "refresh-interval" and pagination_key == last_pagination_key:
+            raise PreventUpdate
         
-        # Final Decision tab shows the Portfolio Manager Decision
-        portfolio_report = reports.get("final_trade_decision") or "No final decision available yet."
+        return create_report_symbol_pagination(), pagination_key
+
+    # ⚡ IMMEDIATE BUTTON UPDATE - the active button and pages are toggled in the browser
+    app.clientside_callback(
+        ClientsideFunction(namespace="reports", function_name="selectSymbol"),
+        [Output("report-pagination", "active_page", allow_duplicate=True),
+         Output("chart-pagination", "active_page", allow_duplicate=True),
+         Output({"type": "symbol-btn", "index": ALL, "component": "reports"}, "color"),
+         Output({"type": "symbol-btn", "index": ALL, "component": "reports"}, "className")],
+        [Input({"type": "symbol-btn", "index": ALL, "component": "reports"}, "n_clicks")],
+        prevent_initial_call=True
+    )
+
+    @app.callback(
+        Input({"type": "symbol-btn", "index": ALL, "component": "reports"}, "n_clicks"),
+        prevent_initial_call=True
+    )
+    def handle_report_symbol_click(symbol_clicks):
+        """Track the clicked report symbol as the current symbol on the server"""
+        if not any(symbol_clicks) or not ctx.triggered:
+            return
         
-        return (
-            create_markdown_content(market_report, "No market analysis available yet.", "market_report"),
-            create_markdown_content(sentiment_report, "No sentiment analysis available yet.", "sentiment_report"),
-            create_markdown_content(news_report, "No news analysis available yet.", "news_report"),
-            create_markdown_content(fundamentals_report, "No fundamentals analysis available yet.", "fundamentals_report"),
-            create_markdown_content(macro_report, "No macro analysis available yet.", "macro_report"),
-            create_markdown_content(research_manager_report, "No research manager decision available yet.", "research_manager_report"),
-            create_markdown_content(trader_report, "No trader report available yet.", "trader_investment_plan"),
-            create_markdown_content(portfolio_report, "No final decision available yet.", "final_trade_decision")
-        )
+        # Find which button was clicked
+        button_id = ctx.triggered[0]["prop_id"]
+        if "symbol-btn" in button_id:
+            # Extract index from the button ID - the pattern-matching id has a fixed schema
+            match = _SYMBOL_BTN_INDEX_RE.search(button_id)
+            if match:
+                clicked_index = int(match.group(1))
+            else:
+                clicked_index = json.loads(button_id.split('.')[0])["index"]
+            
+            # Update current symbol
+            symbols = app_state.symbols_list()
+            if 0 <= clicked_index < len(symbols):
+                app_state.current_symbol = symbols[clicked_index]
 
     @app.callback(
-        Output("decision-summary", "children"),
+        [Output("researcher-debate-tab-content", "children"),
+         Output("risk-debate-tab-content", "children"),
+         Output("market-analysis-tab-content", "children"),
+         Output("social-sentiment-tab-content", "children"),
+         Output("news-analysis-tab-content", "children"),
+         Output("fundamentals-analysis-tab-content", "children"),
+         Output("macro-analysis-tab-content", "children"),
+         Output("research-manager-tab-content", "children"),
+         Output("trader-plan-tab-content", "children"),
+         Output("final-decision-tab-content", "children"),
+         Output("decision-summary", "children"),
+         Output("report-views-key", "data")],
         [Input("report-pagination", "active_page"),
-         Input("medium-refresh-interval", "n_intervals")]
+         Input("medium-refresh-interval", "n_intervals")],
+        [State("report-views-key", "data")]
     )
-    def update_decision_summary(active_page, n_intervals):
-        """Update the decision summary"""
+    def update_all_symbol_views(active_page, n_intervals, last_views_key):
+        """Update the debates, analysis tabs and decision summary for the selected symbol"""
         if not app_state.symbol_states or not active_page:
-            return "Analysis not complete yet."
+            return _NO_ANALYSIS_VIEWS
 
         # Safeguard against accessing invalid page index (e.g., after page refresh)
-        symbols_list = list(app_state.symbol_states.keys())
+        symbols_list = app_state.symbols_list()
         if active_page > len(symbols_list):
-            return "Page index out of range. Please refresh or restart analysis."
+            return _OUT_OF_RANGE_VIEWS
 
         symbol = symbols_list[active_page - 1]
         state = app_state.get_state(symbol)
 
         if not state:
-            return "No data for this symbol."
-
-        reports = state["current_reports"]
-        final_report_content = reports.get("final_trade_decision")
-
-        # A race condition can occur where the final report is generated but the analysis_complete flag is not yet set.
-        # We should only show the final decision when the state is confirmed as complete.
-        if state.get("analysis_complete") and final_report_content is not None:
-            if state["analysis_results"]:
-                decision_text = f"## Final Decision for {state['ticker_symbol']}\n\n"
-                decision_text += f"**Trade Action:** {state['analysis_results'].get('decision', 'No decision')}\n\n"
-                decision_text += "**Date:** " + state['analysis_results'].get("date", "N/A")
-            else:
-                # Show the recommended action if available
-                decision_text = f"## Final Decision for {state['ticker_symbol']}\n\n"
-                
-                # Display the extracted recommendation prominently
-                if "recommended_action" in state and state["recommended_action"]:
-                    decision_text += f"**📈 RECOMMENDED ACTION: {state['recommended_action']}**\n\n"
-                
-                decision_text += "**Full Analysis:**\n"
-                decision_text += final_report_content
+            return (
+                placeholder_markdown(f"No active analysis for {symbol}. Researcher debate will appear here once analysis starts."),
+                placeholder_markdown(f"No active analysis for {symbol}. Risk debate will appear here once analysis starts."),
+                *_NO_SYMBOL_DATA_TABS,
+                "No data for this symbol.",
+                {}
+            )
+
+        # Debates only change when their history grows - on refresh ticks skip unchanged ones
+        # and append new messages rather than resending the whole conversation.
+        # Compare against the views key stored in this browser, which only holds what it actually applied
+        is_refresh_tick = ctx.triggered_id == "medium-refresh-interval"
+        last_views_key = last_views_key or {}
+        views_key = {}
+
+        researcher_debate = get_debate_update(
+            symbol, state, "investment_debate_state", create_researcher_debate_content,
+            ("bull_messages", "bear_messages"), last_views_key, views_key, is_refresh_tick
+        )
+        risk_debate = get_debate_update(
+            symbol, state, "risk_debate_state", create_risk_debate_content,
+            ("risky_messages", "safe_messages", "neutral_messages"), last_views_key, views_key, is_refresh_tick
+        )
+
+        # Most refresh ticks find the reports and analyst statuses untouched
+        tabs_key = analysis_tabs_fingerprint(symbol, state)
+        if is_refresh_tick and tabs_key == last_views_key.get("tabs"):
+            analysis_tabs = _UNCHANGED_TABS
         else:
-            # Show partial decision summary based on available reports
-            available_reports = []
-            if state["current_reports"].get("market_report"):
-                available_reports.append("Market Analysis")
-            if state["current_reports"].get("sentiment_report"):
-                available_reports.append("Social Media Sentiment")
-            if state["current_reports"].get("news_report"):
-                available_reports.append("News Analysis")
-            if state["current_reports"].get("fundamentals_report"):
-                available_reports.append("Fundamentals Analysis")
-            if state["current_reports"].get("macro_report"):
-                available_reports.append("Macro Analysis")
-            if state["current_reports"].get("research_manager_report"):
-                available_reports.append("Research Manager Decision")
-            if state["current_reports"].get("trader_investment_plan"):
-                available_reports.append("Trader Investment Plan")
-            if state.get("risk_debate_state", {}).get("history"):
-                available_reports.append("Risk Debate")
-            if final_report_content is not None:
-                available_reports.append("Portfolio Manager Final Decision")
-            
-            if available_reports:
-                decision_text = f"## Partial Analysis for {state['ticker_symbol']}\n\n"
-                decision_text += "**Completed Reports:** " + ", ".join(available_reports) + "\n\n"
-                
-                # Show the latest available decision as "Current Decision"
-                risk_debate_latest = ""
-                if state.get("risk_debate_state", {}).get("history"):
-                    # Get the last message from risk debate
-                    risk_history = state["risk_debate_state"]["history"]
-                    if risk_history:
-                        risk_debate_latest = risk_history.split('\n')[-1] if risk_history else ""
-                
-                current_decision = (
-                    final_report_content or
-                    risk_debate_latest or
-                    state["current_reports"].get("trader_investment_plan") or
-                    state["current_reports"].get("research_manager_report")
-                )
-                
-                if current_decision:
-                    decision_text += "**Current Decision:** Based on completed analysis\n\n"
-                    decision_text += current_decision
-            else:
-                decision_text = "Analysis not complete yet."
-        
-        return decision_text
+            analysis_tabs = create_analysis_tabs_content(state)
+        views_key["tabs"] = tabs_key
 
-    @app.callback(
+        return (
+            researcher_debate,
+            risk_debate,
+            *analysis_tabs,
+            create_decision_summary(state),
+            dash.no_update if views_key == last_views_key else views_key
+        )
+
+    # Symbol display and tab switching are pure lookups - handled in the browser (assets/reports.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace="reports", function_name="reportDisplayText"),
         Output("current-symbol-report-display", "children"),
-        [Input("report-pagination", "active_page")]
+        [Input("report-pagination", "active_page"),
+         Input({"type": "symbol-btn", "index": ALL, "component": "reports"}, "children")]
     )
-    def update_report_display_text(active_page):
-        if not app_state.symbol_states or not active_page:
-            return ""
-        
-        # Safeguard against accessing invalid page index (e.g., after page refresh)
-        symbols_list = list(app_state.symbol_states.keys())
-        if active_page > len(symbols_list):
-            return "Invalid page"
-        
-        symbol = symbols_list[active_page - 1]
-        return f"📊 {symbol}"
 
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction(namespace="reports", function_name="switchTab"),
         Output("tabs", "active_tab"),
         [Input("nav-market", "n_clicks"),
          Input("nav-social", "n_clicks"),
@@ -815,29 +876,6 @@ def register_report_callbacks(app):
          Input("nav-risk-neut", "n_clicks"),
          Input("nav-final", "n_clicks")]
     )
-    def switch_tab(*args):
-        """Switch between tabs based on navigation clicks"""
-        ctx = dash.callback_context
-        if not ctx.triggered:
-            return "market-analysis"
-        
-        trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
-        
-        tab_mapping = {
-            "nav-market": "market-analysis",
-            "nav-social": "social-sentiment", 
-            "nav-news": "news-analysis",
-            "nav-fundamentals": "fundamentals-analysis",
-            "nav-researcher": "researcher-debate",
-            "nav-research-mgr": "research-manager",
-            "nav-trader": "trader-plan",
-            "nav-risk-agg": "risk-debate",
-            "nav-risk-cons": "risk-debate", 
-            "nav-risk-neut": "risk-debate",
-            "nav-final": "final-decision"
-        }
-        
-        return tab_mapping.get(trigger_id, "market-analysis")
 
     # Prompt Modal Callbacks
     @app.callback(
@@ -870,8 +908,6 @@ def register_report_callbacks(app):
         # Open modal with specific prompt
         if "show-prompt-btn" in trigger_id and any(show_clicks):
             # Find which button was clicked
-            import json
-            
             # Extract the report type from the button that was clicked
             for i, clicks in enumerate(show_clicks):
                 if clicks:
@@ -962,8 +998,6 @@ def register_report_callbacks(app):
         # Open modal with tool outputs for specific report
         if "show-tool-outputs-btn" in trigger_id and any(show_clicks):
             # Find which button was clicked
-            import json
-            
             # Extract the report type from the button that was clicked
             for i, clicks in enumerate(show_clicks):
                 if clicks:
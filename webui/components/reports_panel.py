@@ -263,7 +263,11 @@ def create_reports_panel():
                     "is_open": False,
                     "report_type": None,
                     "title": "Tool Outputs"
-                })
+                }),
+                # Fingerprint of the symbol buttons this browser last received
+                dcc.Store(id="report-pagination-key"),
+                # Versions of the symbol report views this browser last received
+                dcc.Store(id="report-views-key", data={})
             ], style={"display": "none"}),
             
             # Hidden original pagination component for control callback compatibility
@@ -7,6 +7,10 @@ class AppState:
     def __init__(self):
         self.analysis_queue = []
         self.symbol_states = {}
+        self._symbols_version = 0  # Bumped whenever symbols are added to or removed from symbol_states
+        self._symbols_cache_version = -1
+        self._symbols_cache = []
+        self.symbol_to_index = {}  # Position of each symbol in symbol_states, kept in step with it
         self.current_symbol = None  # Symbol displayed in UI
         self.analyzing_symbol = None  # Symbol currently being analyzed (backend)
         self.analysis_running = False
@@ -106,6 +110,14 @@ class AppState:
         self.analyzing_symbol = None
         return None
 
+    def symbols_list(self):
+        """Get the ordered list of symbols (cached until symbols are added or removed; do not mutate)."""
+        version = self._symbols_version
+        if self._symbols_cache_version != version:
+            self._symbols_cache = list(self.symbol_states)
+            self._symbols_cache_version = version
+        return self._symbols_cache
+
     def get_state(self, symbol):
         """Get the state for a specific symbol."""
         return self.symbol_states.get(symbol)
@@ -131,6 +143,8 @@ class AppState:
         session_id = str(uuid.uuid4())[:8]
         session_start = time.time()
         
+        is_new_symbol = symbol not in self.symbol_states
+        
         self.symbol_states[symbol] = {
             "agent_statuses": {
                 "Market Analyst": "pending",
@@ -191,6 +205,11 @@ class AppState:
             "session_start_time": session_start,
             "report_timestamps": {}  # Track when each report was last updated
         }
+        
+        # Update only once the symbol is in symbol_states so symbols_list() never caches a list missing it
+        if is_new_symbol:
+            self.symbol_to_index[symbol] = len(self.symbol_to_index)
+            self._symbols_version += 1
 
     def update_agent_status(self, agent, status, symbol=None):
         """Update the status of an agent for a specific symbol (or current symbol if none specified)."""
@@ -234,6 +253,8 @@ class AppState:
         print("[STATE] Resetting application state")
         self.analysis_queue = []
         self.symbol_states = {}
+        self.symbol_to_index = {}
+        self._symbols_version += 1
         self.current_symbol = None
         self.analysis_running = False
         self.analysis_trace = []